@@ -651,8 +651,10 @@ class SpyderEnvManagerWidget(PluginMainWidget):
 
         """
         if action_result:
+            self.packages_table.discard_optimistic_update()
             self.current_environment_changed()
         else:
+            self.packages_table.revert_optimistic_update()
             self._message_error_box(result_message)
             self.stop_spinner()
 
@@ -816,6 +818,7 @@ class SpyderEnvManagerWidget(PluginMainWidget):
                 env_name=env_name,
                 external_executable=external_executable,
             )
+            self.packages_table.apply_optimistic_update(action, package_name)
             self._run_env_manager_action(
                 manager,
                 manager.uninstall,
@@ -830,6 +833,10 @@ class SpyderEnvManagerWidget(PluginMainWidget):
             packages = [f"{package_name}"]
             if package_constraint != "latest" and package_version:
                 packages = [f"{package_name}{package_constraint}{package_version}"]
+            if package_constraint == "==" and package_version:
+                self.packages_table.apply_optimistic_update(
+                    action, package_name, new_version=package_version
+                )
             env_name = self.select_environment.currentText()
             manager = Manager(
                 backend,
@@ -12,11 +12,16 @@ Package table widget.
 This is the main widget used in the Spyder env Manager plugin
 """
 
+# Standard library imports
+from itertools import compress
+import re
+import sys
+
 # Third library imports
 from qtpy.compat import to_qvariant
 from qtpy.QtCore import QAbstractTableModel, QModelIndex, Qt, Signal
-from qtpy.QtGui import QColor
-from qtpy.QtWidgets import QAbstractItemView, QTableView
+from qtpy.QtGui import QColor, QFontMetrics
+from qtpy.QtWidgets import QAbstractItemView, QHeaderView, QTableView
 
 # Spyder and local imports
 from spyder.api.translations import get_translation
@@ -33,6 +38,27 @@ _ = get_translation("spyder")
 # Column constants
 NAME, VERSION, DESCRIPTION = [0, 1, 2]
 
+# Number of packages above which rows are fetched by the view incrementally
+LAZY_LOADING_THRESHOLD = 1000
+
+# Number of rows fetched each time the view needs more rows
+FETCH_SIZE = 100
+
+# Version parts used to sort versions in natural order
+VERSION_PARTS_REGEX = re.compile(r"\d+|[^\d.+_-]+")
+
+
+def version_sort_key(version):
+    """
+    Get a key to sort the given version in natural order (e.g. 1.9 < 1.10).
+
+    Numeric parts are sorted before text parts at the same position.
+    """
+    return tuple(
+        (0, int(part), "") if part.isdigit() else (1, 0, part)
+        for part in VERSION_PARTS_REGEX.findall(version.lower())
+    )
+
 
 class EnvironmentPackagesActions:
     """
@@ -53,9 +79,331 @@ class EnvironmentPackagesModel(QAbstractTableModel):
     def __init__(self, parent):
         super().__init__(parent)
         self.all_packages = []
+        self.requested_packages = []
         self.packages = []
         self.packages_map = {}
 
+        # Packages information stored by column, indexed by row. This avoids
+        # per cell dictionary lookups when the view queries the model.
+        self._names = []
+        self._versions = []
+        self._descriptions = []
+        self._requested = []
+        self._columns = (self._names, self._versions, self._descriptions)
+
+        # Rows of the requested packages, used to check if a row needs to be
+        # highlighted without indexing the requested flags on every paint
+        self._requested_rows = frozenset()
+
+        # Number of rows exposed to the view. For big environments rows are
+        # exposed incrementally through `canFetchMore` and `fetchMore`
+        self._fetched_rows = 0
+
+        # Current sort and sort keys by column. Keys are computed the first
+        # time a column is sorted and invalidated when the packages change
+        self._sort_column = NAME
+        self._sort_order = Qt.AscendingOrder
+        self._sort_keys = {}
+
+        # Values returned by `data` that don't depend on the cell. They are
+        # computed once since Qt queries them for every visible cell on paint.
+        self._font = to_qvariant(get_font(font_size_delta=DEFAULT_SMALL_DELTA))
+        self._alignment = to_qvariant(int(Qt.AlignCenter))
+        self._requested_background = to_qvariant(
+            QColor(SpyderPalette.COLOR_OCCURRENCE_4)
+        )
+        self._empty = to_qvariant()
+
+        # Header values, indexed by column constant
+        self._headers = (
+            to_qvariant(_("Name")),
+            to_qvariant(_("Version")),
+            to_qvariant(_("Description")),
+        )
+        self._horizontal_header_alignment = to_qvariant(
+            int(Qt.AlignHCenter | Qt.AlignVCenter)
+        )
+        self._vertical_header_alignment = to_qvariant(
+            int(Qt.AlignRight | Qt.AlignVCenter)
+        )
+
+    def set_packages(self, packages):
+        """
+        Set the packages shown by the model.
+
+        Parameters
+        ----------
+        packages : list[dict]
+            Packages to be shown. See `EnvironmentPackagesTable.load_packages`
+            for the expected package structure.
+
+        Returns
+        -------
+        None.
+
+        """
+        self.beginResetModel()
+        self.packages = packages
+        self._names = [package["name"] for package in packages]
+        self._versions = [package["version"] for package in packages]
+        self._descriptions = [package["description"] for package in packages]
+        self._requested = [package["requested"] for package in packages]
+        self._columns = (self._names, self._versions, self._descriptions)
+        self._sort_keys = {}
+        if not self._default_sort():
+            self._sort_rows()
+        self._update_requested_rows()
+        self._update_packages_map()
+        if len(packages) > LAZY_LOADING_THRESHOLD:
+            self._fetched_rows = FETCH_SIZE
+        else:
+            self._fetched_rows = len(packages)
+        self.endResetModel()
+
+    def update_packages(self, packages):
+        """
+        Update the shown packages notifying the view only about changed rows.
+
+        Rows of packages that are no longer available are removed, rows of new
+        packages are inserted and rows whose information changed are updated
+        in place. Only rows already fetched by the view are notified. If the
+        packages that are kept don't preserve their relative order or the rows
+        are sorted by other column than the name, the model is reset instead.
+
+        Parameters
+        ----------
+        packages : list[dict]
+            Packages to be shown. See `EnvironmentPackagesTable.load_packages`
+            for the expected package structure.
+
+        Returns
+        -------
+        None.
+
+        """
+        if not self._default_sort():
+            self.set_packages(packages)
+            return
+
+        self._sort_keys = {}
+
+        # Work on a copy since the current list can be shared with the caller
+        self.packages = list(self.packages)
+        rows_lists = (
+            self.packages,
+            self._names,
+            self._versions,
+            self._descriptions,
+            self._requested,
+        )
+        new_names = {package["name"] for package in packages}
+
+        # Remove packages no longer available, by blocks of contiguous rows
+        row = len(self._names) - 1
+        while row >= 0:
+            if self._names[row] in new_names:
+                row -= 1
+                continue
+            last_row = row
+            while row >= 0 and self._names[row] not in new_names:
+                row -= 1
+            first_row = row + 1
+            # Rows not fetched yet by the view are removed without notifying it
+            fetched_count = min(last_row + 1, self._fetched_rows) - first_row
+            if fetched_count > 0:
+                self.beginRemoveRows(
+                    QModelIndex(), first_row, first_row + fetched_count - 1
+                )
+            for rows_list in rows_lists:
+                del rows_list[first_row : last_row + 1]
+            if fetched_count > 0:
+                self._fetched_rows -= fetched_count
+                self.endRemoveRows()
+
+        current_names = set(self._names)
+        kept_names = [
+            package["name"] for package in packages if package["name"] in current_names
+        ]
+        if kept_names != self._names:
+            self.set_packages(packages)
+            return
+
+        # Update kept packages and insert new ones, by blocks of contiguous rows
+        row = 0
+        while row < len(packages):
+            package = packages[row]
+            if row < len(self._names) and self._names[row] == package["name"]:
+                self.packages[row] = package
+                if (
+                    self._versions[row] != package["version"]
+                    or self._descriptions[row] != package["description"]
+                    or self._requested[row] != package["requested"]
+                ):
+                    self._versions[row] = package["version"]
+                    self._descriptions[row] = package["description"]
+                    self._requested[row] = package["requested"]
+                    if row < self._fetched_rows:
+                        self.dataChanged.emit(
+                            self.index(row, 0),
+                            self.index(row, self.columnCount() - 1),
+                        )
+                row += 1
+                continue
+            first_row = row
+            while row < len(packages) and packages[row]["name"] not in current_names:
+                row += 1
+            new_packages = packages[first_row:row]
+            # Rows inserted after the ones fetched by the view are left to be
+            # fetched later, unless all rows were already fetched
+            fetched = first_row < self._fetched_rows or not self.canFetchMore(
+                QModelIndex()
+            )
+            if fetched:
+                self.beginInsertRows(QModelIndex(), first_row, row - 1)
+            self.packages[first_row:first_row] = new_packages
+            self._names[first_row:first_row] = [
+                package["name"] for package in new_packages
+            ]
+            self._versions[first_row:first_row] = [
+                package["version"] for package in new_packages
+            ]
+            self._descriptions[first_row:first_row] = [
+                package["description"] for package in new_packages
+            ]
+            self._requested[first_row:first_row] = [
+                package["requested"] for package in new_packages
+            ]
+            if fetched:
+                self._fetched_rows += len(new_packages)
+                self.endInsertRows()
+
+        self._update_requested_rows()
+        self._update_packages_map()
+
+    def remove_package(self, row):
+        """
+        Remove the package shown in the given row.
+
+        Parameters
+        ----------
+        row : int
+            Row of the package to remove.
+
+        Returns
+        -------
+        None.
+
+        """
+        # Rows not fetched yet by the view can be removed without notifying it
+        fetched = row < self._fetched_rows
+        if fetched:
+            self.beginRemoveRows(QModelIndex(), row, row)
+        # Work on a copy since the current list can be shared with the caller
+        self.packages = list(self.packages)
+        for rows_list in (
+            self.packages,
+            self._names,
+            self._versions,
+            self._descriptions,
+            self._requested,
+        ):
+            del rows_list[row]
+        self._sort_keys = {}
+        self._update_requested_rows()
+        self._update_packages_map()
+        if fetched:
+            self._fetched_rows -= 1
+            self.endRemoveRows()
+
+    def set_package_version(self, row, version):
+        """
+        Change the version shown for the package in the given row.
+
+        Parameters
+        ----------
+        row : int
+            Row of the package to modify.
+        version : str
+            New version of the package.
+
+        Returns
+        -------
+        None.
+
+        """
+        # Replace the package information instead of modifying it since it can
+        # be shared with the caller
+        package = dict(self.packages[row], version=version)
+        self.packages = list(self.packages)
+        self.packages[row] = package
+        self._versions[row] = version
+        self._sort_keys.pop(VERSION, None)
+        if row < self._fetched_rows:
+            self.dataChanged.emit(
+                self.index(row, 0), self.index(row, self.columnCount() - 1)
+            )
+
+    def _default_sort(self):
+        """Return True if the rows are sorted as given (by name, ascending)."""
+        return self._sort_column == NAME and self._sort_order == Qt.AscendingOrder
+
+    def _get_sort_keys(self, column):
+        """Get the sort keys of the given column, computing them if needed."""
+        keys = self._sort_keys.get(column)
+        if keys is None:
+            if column == VERSION:
+                keys = list(map(version_sort_key, self._versions))
+            else:
+                keys = [value.lower() for value in self._columns[column]]
+            self._sort_keys[column] = keys
+        return keys
+
+    def _sort_rows(self):
+        """
+        Sort the rows by the current sort column and order.
+
+        Returns
+        -------
+        list[int]
+            New row of each of the rows before sorting.
+
+        """
+        keys = self._get_sort_keys(self._sort_column)
+        permutation = sorted(
+            range(len(keys)),
+            key=keys.__getitem__,
+            reverse=self._sort_order == Qt.DescendingOrder,
+        )
+        self.packages = [self.packages[row] for row in permutation]
+        self._names = [self._names[row] for row in permutation]
+        self._versions = [self._versions[row] for row in permutation]
+        self._descriptions = [self._descriptions[row] for row in permutation]
+        self._requested = [self._requested[row] for row in permutation]
+        self._columns = (self._names, self._versions, self._descriptions)
+        self._sort_keys = {
+            column: [column_keys[row] for row in permutation]
+            for column, column_keys in self._sort_keys.items()
+        }
+
+        new_rows = [0] * len(permutation)
+        for new_row, row in enumerate(permutation):
+            new_rows[row] = new_row
+        return new_rows
+
+    def _update_packages_map(self):
+        """Map the shown packages names to their row."""
+        self.packages_map = dict(zip(self._names, range(len(self._names))))
+
+    def _update_requested_rows(self):
+        """Compute the rows of the requested packages."""
+        self._requested_rows = frozenset(
+            compress(range(len(self._requested)), self._requested)
+        )
+
+    def is_requested(self, row):
+        """Return True if the package in the given row was requested."""
+        return row in self._requested_rows
+
     def flags(self, index):
         """Qt Override."""
         if not index.isValid():
@@ -65,51 +413,66 @@ class EnvironmentPackagesModel(QAbstractTableModel):
     def data(self, index, role=Qt.DisplayRole):
         """Qt Override."""
         row = index.row()
-        if not index.isValid() or not (0 <= row < len(self.packages)):
-            return to_qvariant()
-
-        package = self.packages[row]
-        column = index.column()
+        if not index.isValid() or not (0 <= row < self._fetched_rows):
+            return self._empty
 
         if role == Qt.DisplayRole:
-            if column == NAME:
-                text = package["name"]
-                return to_qvariant(text)
-            elif column == DESCRIPTION:
-                text = package["description"]
-                return to_qvariant(text)
-            elif column == VERSION:
-                text = package["version"]
-                return to_qvariant(text)
+            return to_qvariant(self._columns[index.column()][row])
         elif role == Qt.TextAlignmentRole:
-            return to_qvariant(int(Qt.AlignCenter))
+            return self._alignment
         elif role == Qt.FontRole:
-            return to_qvariant(get_font(font_size_delta=DEFAULT_SMALL_DELTA))
+            return self._font
         elif role == Qt.BackgroundColorRole:
-            if package["requested"]:
-                return to_qvariant(QColor(SpyderPalette.COLOR_OCCURRENCE_4))
-        return to_qvariant()
+            if row in self._requested_rows:
+                return self._requested_background
+        return self._empty
 
     def headerData(self, section, orientation, role=Qt.DisplayRole):
         """Qt Override."""
         if role == Qt.TextAlignmentRole:
             if orientation == Qt.Horizontal:
-                return to_qvariant(int(Qt.AlignHCenter | Qt.AlignVCenter))
-            return to_qvariant(int(Qt.AlignRight | Qt.AlignVCenter))
-        if role != Qt.DisplayRole:
-            return to_qvariant()
-        if orientation == Qt.Horizontal:
-            if section == NAME:
-                return to_qvariant(_("Name"))
-            elif section == DESCRIPTION:
-                return to_qvariant(_("Description"))
-            elif section == VERSION:
-                return to_qvariant(_("Version"))
-        return to_qvariant()
+                return self._horizontal_header_alignment
+            return self._vertical_header_alignment
+        if role == Qt.DisplayRole and orientation == Qt.Horizontal:
+            return self._headers[section]
+        return self._empty
+
+    def sort(self, column, order=Qt.AscendingOrder):
+        """Qt Override."""
+        self._sort_column = column
+        self._sort_order = order
+        if not self._names:
+            return
+
+        self.layoutAboutToBeChanged.emit()
+        new_rows = self._sort_rows()
+        self._update_requested_rows()
+        self._update_packages_map()
+        old_indexes = self.persistentIndexList()
+        new_indexes = [
+            self.index(new_rows[index.row()], index.column()) for index in old_indexes
+        ]
+        self.changePersistentIndexList(old_indexes, new_indexes)
+        self.layoutChanged.emit()
 
     def rowCount(self, index=QModelIndex()):
         """Qt Override."""
-        return len(self.packages)
+        return self._fetched_rows
+
+    def canFetchMore(self, index=QModelIndex()):
+        """Qt Override."""
+        return self._fetched_rows < len(self._names)
+
+    def fetchMore(self, index=QModelIndex()):
+        """Qt Override."""
+        count = min(FETCH_SIZE, len(self._names) - self._fetched_rows)
+        if count <= 0:
+            return
+        self.beginInsertRows(
+            QModelIndex(), self._fetched_rows, self._fetched_rows + count - 1
+        )
+        self._fetched_rows += count
+        self.endInsertRows()
 
     def columnCount(self, index=QModelIndex()):
         """Qt Override."""
@@ -132,10 +495,43 @@ class EnvironmentPackagesTable(QTableView, SpyderWidgetMixin):
         show the context menu of this widget.
     """
 
+    COLUMN_RATIOS = (0.25, 0.20, 0.55)
+    """Fraction of the viewport width used by each column, by column constant."""
+
+    _ENTER_KEYS = frozenset({Qt.Key_Enter, Qt.Key_Return})
+
     def __init__(self, parent):
         super().__init__(parent, class_parent=parent)
         # Setup context menu
         self.context_menu = self.create_menu(EnvironmentPackagesMenu.PackageContextMenu)
+        self.context_menu.setMinimumWidth(100)
+        self._context_menu_row = None
+        update_action = self.create_action(
+            EnvironmentPackagesActions.UpdatePackage,
+            _("Update package"),
+            triggered=lambda triggered: self._trigger_context_menu_action(
+                EnvironmentPackagesActions.UpdatePackage
+            ),
+            overwrite=True,
+        )
+        uninstall_action = self.create_action(
+            EnvironmentPackagesActions.UninstallPackage,
+            _("Uninstall package"),
+            triggered=lambda triggered: self._trigger_context_menu_action(
+                EnvironmentPackagesActions.UninstallPackage
+            ),
+            overwrite=True,
+        )
+        change_action = self.create_action(
+            EnvironmentPackagesActions.InstallPackageVersion,
+            _("Change package version with a constraint"),
+            triggered=lambda triggered: self._trigger_context_menu_action(
+                EnvironmentPackagesActions.InstallPackageVersion
+            ),
+            overwrite=True,
+        )
+        for menu_action in [update_action, uninstall_action, change_action]:
+            self.add_item_to_menu(menu_action, self.context_menu)
 
         # Setup table model
         self.source_model = EnvironmentPackagesModel(self)
@@ -146,7 +542,22 @@ class EnvironmentPackagesTable(QTableView, SpyderWidgetMixin):
         self.setSelectionMode(QAbstractItemView.SingleSelection)
         self.setEditTriggers(QAbstractItemView.AllEditTriggers)
         self.verticalHeader().hide()
+        # Use a fixed rows height so the view doesn't need to compute it
+        font_metrics = QFontMetrics(get_font(font_size_delta=DEFAULT_SMALL_DELTA))
+        self.verticalHeader().setSectionResizeMode(QHeaderView.Fixed)
+        self.verticalHeader().setDefaultSectionSize(font_metrics.height() + 4)
+        self.setWordWrap(False)
         self.horizontalHeader().setStretchLastSection(True)
+        self.horizontalHeader().setSortIndicator(NAME, Qt.AscendingOrder)
+        self.setSortingEnabled(True)
+        self.verticalScrollBar().valueChanged.connect(self._fetch_more_packages)
+
+        # Packages shown before an optimistic update, to be able to revert it
+        self._packages_before_update = None
+
+        # Filter applied to the packages currently shown
+        self._only_requested = None
+
         self.load_packages(False)
 
     def get_package_info(self, index):
@@ -176,7 +587,8 @@ class EnvironmentPackagesTable(QTableView, SpyderWidgetMixin):
             True if the packages should be filtered and only requested packages
             be kept. The default is False.
         packages : list[dict], optional
-            List of packages to be displayed on the widget. The default is None.
+            List of packages to be displayed on the widget, which are shown
+            sorted by name. The default is None.
             The expected package structure is as follows:
 
 
@@ -196,23 +608,115 @@ class EnvironmentPackagesTable(QTableView, SpyderWidgetMixin):
         None.
 
         """
+        if packages is None and only_requested == self._only_requested:
+            # Nothing changed since the last load
+            return
+        self._only_requested = only_requested
 
+        new_packages = bool(packages)
         if packages:
+            # Sort once by name, case insensitively as the model sorts the
+            # name column, so the view doesn't need to sort the rows
+            packages = sorted(packages, key=lambda package: package["name"].lower())
             self.source_model.all_packages = packages
-        if not packages and self.source_model.all_packages:
-            packages = self.source_model.all_packages
-        if packages:
+            # Compute the filtered packages once so changing the filter only
+            # needs to switch between lists
+            requested_packages = []
+            for package in packages:
+                # Names are used as keys in several places, intern them to
+                # share a single string and speed up lookups
+                package["name"] = sys.intern(package["name"])
+                if package["requested"]:
+                    requested_packages.append(package)
+            self.source_model.requested_packages = requested_packages
+            self._packages_before_update = None
+        if self.source_model.all_packages:
             if only_requested:
-                packages = list(filter(lambda package: package["requested"], packages))
-            for idx, package in enumerate(packages):
-                package["index"] = idx
-            packages_map = {package["name"]: package for package in packages}
-            self.source_model.beginResetModel()
-            self.source_model.packages = packages
-            self.source_model.packages_map = packages_map
-            self.source_model.endResetModel()
+                packages = self.source_model.requested_packages
+            else:
+                packages = self.source_model.all_packages
+
+            # Paint the table only once after all changes are done
+            self.setUpdatesEnabled(False)
+            try:
+                if self.source_model.rowCount() == 0:
+                    # First load: reset the model and set the initial columns
+                    # width
+                    self.source_model.set_packages(packages)
+                    self.resizeColumnsToContents()
+                elif new_packages:
+                    # Only notify the view about the rows that changed
+                    self.source_model.update_packages(packages)
+                else:
+                    self.source_model.set_packages(packages)
+            finally:
+                self.setUpdatesEnabled(True)
+                self.viewport().update()
+
+    def apply_optimistic_update(self, action, package_name, new_version=None):
+        """
+        Show the expected result of a package action before it finishes.
+
+        Parameters
+        ----------
+        action : str
+            The package action being performed. It should be defined on the
+            `EnvironmentPackagesActions` enum class.
+        package_name : str
+            Name of the package affected by the action.
+        new_version : str, optional
+            Version the package will have after the action, if known.
+            The default is None.
+
+        Returns
+        -------
+        None.
+
+        """
+        self._packages_before_update = None
+        row = self.source_model.packages_map.get(package_name)
+        if row is None:
+            return
+
+        if action == EnvironmentPackagesActions.UninstallPackage:
+            self._packages_before_update = self.source_model.packages
+            self.source_model.remove_package(row)
+        elif new_version and action in (
+            EnvironmentPackagesActions.UpdatePackage,
+            EnvironmentPackagesActions.InstallPackageVersion,
+        ):
+            self._packages_before_update = self.source_model.packages
+            self.source_model.set_package_version(row, new_version)
+
+    def discard_optimistic_update(self):
+        """Forget the packages shown before the last optimistic update."""
+        self._packages_before_update = None
+
+    def revert_optimistic_update(self):
+        """Restore the packages shown before the last optimistic update."""
+        if self._packages_before_update is not None:
+            packages = self._packages_before_update
+            self._packages_before_update = None
+            self.source_model.update_packages(packages)
+
+    def _fetch_more_packages(self, value):
+        """
+        Fetch more packages rows when scrolling close to the end of the rows
+        already fetched.
+        """
+        scrollbar = self.verticalScrollBar()
+        if value >= scrollbar.maximum() - scrollbar.pageStep():
+            if self.source_model.canFetchMore(QModelIndex()):
+                self.source_model.fetchMore(QModelIndex())
+
+    def sizeHintForColumn(self, column):
+        """
+        Qt Override.
 
-            self.resizeColumnToContents(NAME)
+        Return a width based on the viewport width instead of measuring the
+        column contents.
+        """
+        return int(self.viewport().width() * self.COLUMN_RATIOS[column])
 
     def next_row(self):
         """Move to next row from currently selected row."""
@@ -230,60 +734,35 @@ class EnvironmentPackagesTable(QTableView, SpyderWidgetMixin):
             row = rows
         self.selectRow(row - 1)
 
+    def _trigger_context_menu_action(self, action):
+        """
+        Emit the given context menu action for the package of the row where
+        the context menu was requested.
+        """
+        package_info = self.source_model.packages[self._context_menu_row]
+        self.sig_action_context_menu.emit(action, package_info)
+
     def contextMenuEvent(self, event):
         """Qt Override."""
-        self.context_menu.clear_actions()
         row = self.rowAt(event.pos().y())
-        packages = self.source_model.packages
-        if packages and packages[row]["requested"]:
-            update_action = self.create_action(
-                self,
-                _("Update package"),
-                triggered=lambda triggered: self.sig_action_context_menu.emit(
-                    EnvironmentPackagesActions.UpdatePackage, packages[row]
-                ),
-                overwrite=True,
-            )
-            uninstall_action = self.create_action(
-                self,
-                _("Uninstall package"),
-                triggered=lambda triggered: self.sig_action_context_menu.emit(
-                    EnvironmentPackagesActions.UninstallPackage, packages[row]
-                ),
-                overwrite=True,
-            )
-            change_action = self.create_action(
-                self,
-                _("Change package version with a constraint"),
-                triggered=lambda triggered: self.sig_action_context_menu.emit(
-                    EnvironmentPackagesActions.InstallPackageVersion, packages[row]
-                ),
-                overwrite=True,
-            )
-            menu_actions = [
-                update_action,
-                uninstall_action,
-                change_action,
-            ]
-            for menu_action in menu_actions:
-                self.add_item_to_menu(menu_action, self.context_menu)
-            self.context_menu.setMinimumWidth(100)
+        if self.source_model.is_requested(row):
+            self._context_menu_row = row
             self.context_menu.popup(event.globalPos())
             event.accept()
 
     def focusInEvent(self, e):
         """Qt Override."""
         super(EnvironmentPackagesTable, self).focusInEvent(e)
-        self.selectRow(self.currentIndex().row())
+        row = self.currentIndex().row()
+        if row >= 0 and not self.selectionModel().isRowSelected(row, QModelIndex()):
+            self.selectRow(row)
 
     def keyPressEvent(self, event):
         """Qt Override."""
         key = event.key()
-        if key in [Qt.Key_Enter, Qt.Key_Return]:
+        if key in self._ENTER_KEYS:
             self.show_editor()
-        elif key in [Qt.Key_Backtab]:
+        elif key == Qt.Key_Backtab:
             self.parent().reset_btn.setFocus()
-        elif key in [Qt.Key_Up, Qt.Key_Down, Qt.Key_Left, Qt.Key_Right]:
-            super(EnvironmentPackagesTable, self).keyPressEvent(event)
         else:
             super(EnvironmentPackagesTable, self).keyPressEvent(event)
@@ -7,3 +7,217 @@
 """
 Spyder Env Manager widget tests.
 """
+# Third-party imports
+import pytest
+from qtpy.QtCore import Qt
+
+# Local imports
+from spyder_env_manager.spyder.widgets.packages_table import (
+    DESCRIPTION,
+    FETCH_SIZE,
+    LAZY_LOADING_THRESHOLD,
+    NAME,
+    VERSION,
+    EnvironmentPackagesActions,
+    EnvironmentPackagesTable,
+    version_sort_key,
+)
+
+
+def get_packages():
+    return [
+        {
+            "name": "openssl",
+            "description": "OpenSSL is an open-source implementation of SSL",
+            "version": "1.1.1s",
+            "requested": False,
+        },
+        {
+            "name": "python",
+            "description": "General purpose programming language",
+            "version": "3.10.8",
+            "requested": True,
+        },
+    ]
+
+
+def test_packages_table_load_packages(qtbot):
+    """Check the packages model data after loading packages."""
+    table = EnvironmentPackagesTable(None)
+    qtbot.addWidget(table)
+    table.load_packages(False, get_packages())
+    model = table.source_model
+
+    assert model.rowCount() == 2
+    assert model.data(model.index(0, NAME)) == "openssl"
+    assert model.data(model.index(1, VERSION)) == "3.10.8"
+    assert model.data(model.index(0, DESCRIPTION)).startswith("OpenSSL")
+    assert model.data(model.index(0, NAME), Qt.BackgroundColorRole) is None
+    assert model.data(model.index(1, NAME), Qt.BackgroundColorRole) is not None
+    assert table.get_package_info(model.packages_map["openssl"])["version"] == "1.1.1s"
+
+    table.load_packages(True)
+    assert model.rowCount() == 1
+    assert table.get_package_info(0)["name"] == "python"
+
+
+@pytest.mark.parametrize(
+    "lower,higher", [("1.9", "1.10"), ("1.1.1", "1.1.1s"), ("3.9.0", "3.10.8")]
+)
+def test_version_sort_key(lower, higher):
+    """Check versions are sorted in natural order."""
+    assert version_sort_key(lower) < version_sort_key(higher)
+
+
+def test_packages_table_sort(qtbot):
+    """Check sorting the packages by column."""
+    table = EnvironmentPackagesTable(None)
+    qtbot.addWidget(table)
+    table.load_packages(False, get_packages())
+    model = table.source_model
+
+    table.sortByColumn(VERSION, Qt.DescendingOrder)
+    assert table.get_package_info(0)["name"] == "python"
+    assert model.data(model.index(0, VERSION)) == "3.10.8"
+    assert model.packages_map["python"] == 0
+    assert model.is_requested(0)
+
+    table.sortByColumn(NAME, Qt.AscendingOrder)
+    assert table.get_package_info(0)["name"] == "openssl"
+
+
+def test_packages_table_sort_mixed_case_names(qtbot):
+    """Check the loaded order matches sorting by name for mixed-case names."""
+    table = EnvironmentPackagesTable(None)
+    qtbot.addWidget(table)
+    packages = [
+        {"name": name, "description": "", "version": "1.0", "requested": False}
+        for name in ["numpy", "PyYAML", "attrs", "Jinja2"]
+    ]
+    table.load_packages(False, packages)
+    model = table.source_model
+    expected_names = ["attrs", "Jinja2", "numpy", "PyYAML"]
+
+    def shown_names():
+        return [model.data(model.index(row, NAME)) for row in range(model.rowCount())]
+
+    assert shown_names() == expected_names
+
+    table.sortByColumn(NAME, Qt.DescendingOrder)
+    assert shown_names() == expected_names[::-1]
+    table.sortByColumn(NAME, Qt.AscendingOrder)
+    assert shown_names() == expected_names
+
+    table.load_packages(False, list(packages))
+    assert shown_names() == expected_names
+
+
+def test_packages_table_update_packages(qtbot):
+    """Check that reloading packages only updates the rows that changed."""
+    table = EnvironmentPackagesTable(None)
+    qtbot.addWidget(table)
+    table.load_packages(False, get_packages())
+    model = table.source_model
+
+    packages = get_packages()
+    packages[1]["version"] = "3.11.0"
+    packages.append(
+        {
+            "name": "packaging",
+            "description": "Core utilities for Python packages",
+            "version": "22.0",
+            "requested": True,
+        },
+    )
+    with qtbot.waitSignal(model.rowsInserted):
+        table.load_packages(False, packages)
+    assert model.rowCount() == 3
+    assert table.get_package_info(1)["name"] == "packaging"
+    assert model.data(model.index(2, VERSION)) == "3.11.0"
+
+    with qtbot.waitSignal(model.rowsRemoved):
+        table.load_packages(False, packages[1:])
+    assert model.rowCount() == 2
+    assert "openssl" not in model.packages_map
+
+
+def test_packages_table_optimistic_update(qtbot):
+    """Check applying and reverting optimistic package updates."""
+    table = EnvironmentPackagesTable(None)
+    qtbot.addWidget(table)
+    table.load_packages(False, get_packages())
+    model = table.source_model
+
+    table.apply_optimistic_update(EnvironmentPackagesActions.UninstallPackage, "python")
+    assert model.rowCount() == 1
+    assert "python" not in model.packages_map
+    table.revert_optimistic_update()
+    assert model.rowCount() == 2
+    assert table.get_package_info(1)["name"] == "python"
+
+    table.apply_optimistic_update(
+        EnvironmentPackagesActions.InstallPackageVersion, "python", new_version="3.9.0"
+    )
+    assert model.data(model.index(1, VERSION)) == "3.9.0"
+    table.revert_optimistic_update()
+    assert model.data(model.index(1, VERSION)) == "3.10.8"
+
+    # A discarded update can't be reverted later
+    table.apply_optimistic_update(EnvironmentPackagesActions.UninstallPackage, "python")
+    table.discard_optimistic_update()
+    table.revert_optimistic_update()
+    assert model.rowCount() == 1
+
+
+def test_packages_table_lazy_loading(qtbot):
+    """Check that rows are fetched incrementally for big environments."""
+    table = EnvironmentPackagesTable(None)
+    qtbot.addWidget(table)
+    packages = [
+        {
+            "name": f"package-{idx:05}",
+            "description": "",
+            "version": "1.0",
+            "requested": False,
+        }
+        for idx in range(LAZY_LOADING_THRESHOLD + 1)
+    ]
+    table.load_packages(False, packages)
+    model = table.source_model
+
+    assert model.rowCount() == FETCH_SIZE
+    assert model.canFetchMore()
+    while model.canFetchMore():
+        model.fetchMore()
+    assert model.rowCount() == len(packages)
+
+
+def test_packages_table_lazy_loading_update_packages(qtbot):
+    """Check big environments are updated without resetting the model."""
+    table = EnvironmentPackagesTable(None)
+    qtbot.addWidget(table)
+    packages = [
+        {
+            "name": f"package-{idx:05}",
+            "description": "",
+            "version": "1.0",
+            "requested": False,
+        }
+        for idx in range(LAZY_LOADING_THRESHOLD + 1)
+    ]
+    table.load_packages(False, packages)
+    model = table.source_model
+
+    packages = [dict(package) for package in packages[1:]]
+    packages[0]["version"] = "2.0"
+    packages[-1]["version"] = "2.0"
+    with qtbot.assertNotEmitted(model.modelReset):
+        table.load_packages(False, packages)
+    assert model.rowCount() == FETCH_SIZE - 1
+    assert model.data(model.index(0, VERSION)) == "2.0"
+    assert model.packages_map[packages[-1]["name"]] == len(packages) - 1
+
+    while model.canFetchMore():
+        model.fetchMore()
+    assert model.rowCount() == len(packages)
+    assert model.data(model.index(len(packages) - 1, VERSION)) == "2.0"